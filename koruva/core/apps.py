@@ -1,6 +1,32 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+
+def optimize_sqlite(sender, connection, **kwargs) -> None:
+    # 0x10002 forces whole-schema analysis; before SQLite 3.46 a plain
+    # "PRAGMA optimize" only considers tables this connection has already
+    # queried, which at connection-open is none.
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA optimize=0x10002")
 
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "koruva.core"
+
+    def ready(self):
+        connection_created.connect(
+            optimize_sqlite, dispatch_uid="koruva-sqlite-optimize"
+        )
+        if not settings.DEBUG:
+            from django.template.loader import get_template
+
+            from koruva.core.views import warm_favicon_cache
+
+            warm_favicon_cache()
+            # Compiling one template imports the configured builtins
+            # (partials, heroicons) and primes the cached loader, so the
+            # first real request skips that work.
+            get_template("index.html")
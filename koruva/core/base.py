@@ -15,8 +15,8 @@ class TimeStamped(models.Model):
         a parameter to the update field argument.
         """
         update_fields = kwargs.get("update_fields", None)
-        if update_fields:
-            kwargs["update_fields"] = set(update_fields).union({"updated_at"})
+        if update_fields and "updated_at" not in update_fields:
+            kwargs["update_fields"] = (*update_fields, "updated_at")
 
         super().save(*args, **kwargs)
 
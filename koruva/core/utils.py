@@ -1,31 +1,193 @@
 from __future__ import annotations
 
+import binascii
+import json
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from dataclasses import dataclass
+
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.paginator import InvalidPage
 from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
 from django.db.models import QuerySet
 from django.http import Http404
 from django.http import HttpRequest
 
 
+@dataclass(frozen=True)
+class LastPage:
+    """Shim mirroring the Page API for the tail of a queryset."""
+
+    object_list: list
+    previous_exists: bool
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return False
+
+    def has_previous(self) -> bool:
+        return self.previous_exists
+
+
 def paginate_queryset(
     request: HttpRequest,
     queryset: QuerySet,
     page_size: int = settings.DEFAULT_PAGE_SIZE,
 ):
-    paginator = Paginator(queryset, page_size)
     page_number = request.GET.get("page") or 1
+    if page_number == "last":
+        # Walk the reversed ordering and flip in Python: a single indexed
+        # scan from the tail instead of the COUNT(*) behind num_pages.
+        qs = queryset.reverse() if queryset.ordered else queryset.order_by("-pk")
+        object_list = list(qs[: page_size + 1])
+        previous_exists = len(object_list) > page_size
+        object_list = object_list[:page_size]
+        object_list.reverse()
+        return LastPage(object_list, previous_exists)
+
     try:
         page_number = int(page_number)
     except ValueError as e:
-        if page_number == "last":
-            page_number = paginator.num_pages
-        else:
-            msg = "Page is not 'last', nor can it be converted to an int."
-            raise Http404(msg) from e
+        msg = "Page is not 'last', nor can it be converted to an int."
+        raise Http404(msg) from e
 
+    paginator = Paginator(queryset, page_size)
     try:
         return paginator.page(page_number)
     except InvalidPage as exc:
         msg = "Invalid page (%s): %s"
         raise Http404(msg % (page_number, str(exc))) from exc
+
+
+@dataclass(frozen=True)
+class KeysetPage:
+    object_list: list
+    next_cursor: str | None
+    has_next: bool
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+
+def _invert_ordering(field: str) -> str:
+    return field.removeprefix("-") if field.startswith("-") else f"-{field}"
+
+
+def _encode_cursor(values: list) -> str:
+    payload = json.dumps(values, cls=DjangoJSONEncoder).encode()
+    return urlsafe_b64encode(payload).decode()
+
+
+def _decode_cursor(cursor: str, ordering: tuple[str, ...]) -> list:
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error) as e:
+        msg = "Cursor cannot be decoded."
+        raise Http404(msg) from e
+    if not isinstance(values, list) or len(values) != len(ordering):
+        msg = "Cursor does not match the page ordering."
+        raise Http404(msg)
+    return values
+
+
+def _keyset_filter(ordering: tuple[str, ...], values: list) -> Q:
+    # Tuple comparison (f1, f2, ...) > (v1, v2, ...) expressed as a Q chain,
+    # honoring the direction of each ordering field.
+    condition = Q()
+    for idx, (field, value) in enumerate(zip(ordering, values, strict=True)):
+        lookup = "lt" if field.startswith("-") else "gt"
+        clause = Q(**{f"{field.removeprefix('-')}__{lookup}": value})
+        for prev_field, prev_value in zip(ordering[:idx], values[:idx], strict=True):
+            clause &= Q(**{prev_field.removeprefix("-"): prev_value})
+        condition |= clause
+    return condition
+
+
+def paginate_queryset_keyset(
+    request: HttpRequest,
+    queryset: QuerySet,
+    page_size: int = settings.DEFAULT_PAGE_SIZE,
+    order_by: tuple[str, ...] = ("-id",),
+) -> KeysetPage:
+    """
+    Keyset (seek) pagination: the client passes back an opaque ``cursor``
+    holding the ordering values of the last seen row, so every page is a
+    single indexed scan with no COUNT and no OFFSET. The sentinel
+    ``?cursor=last`` returns the final page by walking the reversed
+    ordering and flipping the results in Python.
+    """
+    cursor = request.GET.get("cursor")
+    is_last = cursor == "last"
+    ordering = tuple(_invert_ordering(f) for f in order_by) if is_last else tuple(order_by)
+
+    qs = queryset.order_by(*ordering)
+    try:
+        if cursor and not is_last:
+            qs = qs.filter(_keyset_filter(ordering, _decode_cursor(cursor, ordering)))
+        object_list = list(qs[: page_size + 1])
+    except (ValueError, ValidationError) as e:
+        # decodable cursor whose values don't fit the ordering fields
+        msg = "Cursor does not match the page ordering."
+        raise Http404(msg) from e
+    has_next = len(object_list) > page_size
+    object_list = object_list[:page_size]
+    if is_last:
+        object_list.reverse()
+        has_next = False
+
+    next_cursor = None
+    if has_next:
+        last_obj = object_list[-1]
+        next_cursor = _encode_cursor(
+            [getattr(last_obj, f.removeprefix("-")) for f in ordering]
+        )
+    return KeysetPage(object_list, next_cursor, has_next)
+
+
+def batched_iterator(
+    queryset: QuerySet,
+    chunk_size: int = 2000,
+    batch_size: int = 500,
+) -> Iterator[list]:
+    """
+    Stream a queryset through ``iterator(chunk_size=...)`` (server-side
+    cursors on PostgreSQL) while yielding lists of ``batch_size`` objects,
+    so consumers get grouped processing without buffering the full result
+    set in memory.
+    """
+    batch: list = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        batch.append(obj)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def abatched_iterator(
+    queryset: QuerySet,
+    chunk_size: int = 2000,
+    batch_size: int = 500,
+) -> AsyncIterator[list]:
+    batch: list = []
+    async for obj in queryset.aiterator(chunk_size=chunk_size):
+        batch.append(obj)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import mimetypes
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -8,7 +10,8 @@ from django.contrib.auth.decorators import login_not_required
 from django.contrib.staticfiles import finders
 from django.http import FileResponse
 from django.http import HttpResponse
-from django.shortcuts import render
+from django.http import HttpResponseNotModified
+from django.template.loader import render_to_string
 from django.utils import timezone
 from django.views.decorators.cache import cache_control
 from django.views.decorators.http import require_GET
@@ -17,51 +20,136 @@ if TYPE_CHECKING:
     from django.http import HttpRequest
 
 
+# Captured once so the cache_control decorators don't go through
+# LazySettings.__getattr__ each time the module is (re)evaluated.
+_MAX_AGE_ROBOTS = 0 if settings.DEBUG else settings.CACHE_TIME_ROBOTS_TXT
+_MAX_AGE_SECURITY = 0 if settings.DEBUG else settings.CACHE_TIME_SECURITY_TXT
+_MAX_AGE_FAVICON = 0 if settings.DEBUG else settings.CACHE_TIME_FAVICON
+_MAX_AGE_HOME = 0 if settings.DEBUG else settings.CACHE_TIME_HOME
+
+
+def _make_etag(body: bytes) -> str:
+    return f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+
+# Both bodies are effectively static (security.txt only depends on the
+# year), so render them once instead of going through the template engine
+# and context processors on every hit.
+_ROBOTS_BODY = render_to_string("robots.txt")
+
+_ROBOTS_ETAG = _make_etag(_ROBOTS_BODY.encode())
+
+_HOME_BODY: str | None = None
+
+
+@require_GET
+@cache_control(max_age=_MAX_AGE_HOME, public=True)
+@login_not_required
+def home(request: HttpRequest) -> HttpResponse:
+    # The landing page has no per-user content, so render it once per
+    # process instead of going through TemplateView dispatch and
+    # TemplateResponse.render() on every hit.
+    global _HOME_BODY
+    if _HOME_BODY is None or settings.DEBUG:
+        _HOME_BODY = render_to_string("index.html", request=request)
+    return HttpResponse(_HOME_BODY)
+
+
+_SECURITY_BODY: str | None = None
+_SECURITY_ETAG: str | None = None
+_SECURITY_YEAR: int | None = None
+
+
 @require_GET
 @cache_control(
-    max_age=0 if settings.DEBUG else settings.CACHE_TIME_ROBOTS_TXT,
+    max_age=_MAX_AGE_ROBOTS,
     immutable=True,
     public=True,
 )
 @login_not_required
 def robots_txt(request: HttpRequest) -> HttpResponse:
-    return render(request, "robots.txt", content_type="text/plain")
+    if request.META.get("HTTP_IF_NONE_MATCH") == _ROBOTS_ETAG:
+        return HttpResponseNotModified()
+    response = HttpResponse(_ROBOTS_BODY, content_type="text/plain")
+    response["ETag"] = _ROBOTS_ETAG
+    return response
 
 
 @require_GET
 @cache_control(
-    max_age=0 if settings.DEBUG else settings.CACHE_TIME_SECURITY_TXT,
+    max_age=_MAX_AGE_SECURITY,
     immutable=True,
     public=True,
 )
 @login_not_required
 def security_txt(request: HttpRequest) -> HttpResponse:
-    return render(
-        request,
-        ".well-known/security.txt",
-        context={
-            "year": timezone.now().year + 1,
-        },
-        content_type="text/plain",
-    )
+    global _SECURITY_BODY, _SECURITY_ETAG, _SECURITY_YEAR
+    year = timezone.now().year
+    if _SECURITY_YEAR != year:
+        _SECURITY_BODY = render_to_string(
+            ".well-known/security.txt",
+            context={"year": year + 1},
+        )
+        _SECURITY_ETAG = _make_etag(_SECURITY_BODY.encode())
+        _SECURITY_YEAR = year
+    if request.META.get("HTTP_IF_NONE_MATCH") == _SECURITY_ETAG:
+        return HttpResponseNotModified()
+    response = HttpResponse(_SECURITY_BODY, content_type="text/plain")
+    response["ETag"] = _SECURITY_ETAG
+    return response
+
+
+# The static asset set is fixed, so the finder walk only needs to happen
+# once per process. None marks assets the finders can't resolve.
+_FAVICON_NAMES = ("favicon.ico", "favicon.svg")
+
+_FAVICON_CACHE: dict[str, str | None] = {}
+
+_FAVICON_SVG_FALLBACK = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">'
+    '<text y=".9em" font-size="90">🚀</text>'
+    "</svg>"
+).encode()
+
+_FAVICON_SVG_ETAG = _make_etag(_FAVICON_SVG_FALLBACK)
+
+# body hashes for the resolved assets, computed once per path
+_FAVICON_ETAGS: dict[str, str] = {}
+
+
+def warm_favicon_cache() -> None:
+    # Called from CoreConfig.ready() so the first request never pays the
+    # O(apps) finder walk.
+    for name in _FAVICON_NAMES:
+        _FAVICON_CACHE[name] = finders.find(name)
 
 
 @require_GET
 @cache_control(
-    max_age=0 if settings.DEBUG else settings.CACHE_TIME_FAVICON,
+    max_age=_MAX_AGE_FAVICON,
     immutable=True,
     public=True,
 )
 @login_not_required
 def favicon(request: HttpRequest) -> HttpResponse | FileResponse:
     name = request.path.lstrip("/")
-    if path := finders.find(name):
-        return FileResponse(Path(path).read_bytes())
-    return HttpResponse(
-        (
-            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">'
-            '<text y=".9em" font-size="90">🚀</text>'
-            "</svg>"
-        ),
-        content_type="image/svg+xml",
-    )
+    if settings.DEBUG or name not in _FAVICON_CACHE:
+        _FAVICON_CACHE[name] = finders.find(name)
+    if path := _FAVICON_CACHE[name]:
+        if (etag := _FAVICON_ETAGS.get(path)) is None:
+            etag = _FAVICON_ETAGS[path] = _make_etag(Path(path).read_bytes())
+        if request.META.get("HTTP_IF_NONE_MATCH") == etag:
+            return HttpResponseNotModified()
+        # an open handle lets FileResponse stream via wsgi.file_wrapper /
+        # sendfile instead of copying the body through Python
+        response = FileResponse(
+            open(path, "rb"),
+            content_type=mimetypes.guess_type(name)[0] or "application/octet-stream",
+        )
+        response["ETag"] = etag
+        return response
+    if request.META.get("HTTP_IF_NONE_MATCH") == _FAVICON_SVG_ETAG:
+        return HttpResponseNotModified()
+    response = HttpResponse(_FAVICON_SVG_FALLBACK, content_type="image/svg+xml")
+    response["ETag"] = _FAVICON_SVG_ETAG
+    return response
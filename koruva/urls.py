@@ -5,29 +5,20 @@ from django.contrib.auth.decorators import login_not_required
 from django.urls import include
 from django.urls import path
 from django.views import defaults as default_views
-from django.views.generic import TemplateView
 from health_check.views import MainView
 from koruva.core.views import favicon
+from koruva.core.views import home
 from koruva.core.views import robots_txt
 from koruva.core.views import security_txt
 
 urlpatterns = [
-    path("android-chrome-192x192.png", favicon),
-    path("android-chrome-512x512.png", favicon),
-    path("apple-touch-icon.png", favicon),
-    path("browserconfig.xml", favicon),
-    path("favicon-16x16.png", favicon),
-    path("favicon-32x32.png", favicon),
+    # The favicon family is served straight from WHITENOISE_ROOT; only the
+    # emoji fallback still goes through Python.
     path("favicon.ico", favicon),
-    path("mstile-150x150.png", favicon),
-    path("safari-pinned-tab.svg", favicon),
+    path("favicon.svg", favicon),
     path(".well-known/security.txt", security_txt),
     path("robots.txt", robots_txt),
-    path(
-        "",
-        login_not_required(TemplateView.as_view(template_name="index.html")),
-        name="home",
-    ),
+    path("", home, name="home"),
     path("health/", login_not_required(MainView.as_view())),
     path(settings.ADMIN_URL, admin.site.urls),
 ]
@@ -0,0 +1,121 @@
+from base64 import urlsafe_b64encode
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import Http404
+from django.test import RequestFactory
+
+from koruva.core.utils import batched_iterator
+from koruva.core.utils import paginate_queryset
+from koruva.core.utils import paginate_queryset_keyset
+
+pytestmark = pytest.mark.django_db
+
+
+def get_request(query: str = ""):
+    return RequestFactory().get(f"/{query}")
+
+
+def make_cursor(payload: bytes) -> str:
+    return urlsafe_b64encode(payload).decode()
+
+
+@pytest.fixture
+def users():
+    return [
+        User.objects.create(username=f"user{i}", email=f"user{i}@example.com")
+        for i in range(5)
+    ]
+
+
+def test_keyset_cursor_walk(users):
+    page = paginate_queryset_keyset(get_request(), User.objects.all(), page_size=2)
+    assert [u.pk for u in page] == [users[4].pk, users[3].pk]
+    assert page.has_next
+
+    page = paginate_queryset_keyset(
+        get_request(f"?cursor={page.next_cursor}"), User.objects.all(), page_size=2
+    )
+    assert [u.pk for u in page] == [users[2].pk, users[1].pk]
+    assert page.has_next
+
+    page = paginate_queryset_keyset(
+        get_request(f"?cursor={page.next_cursor}"), User.objects.all(), page_size=2
+    )
+    assert [u.pk for u in page] == [users[0].pk]
+    assert not page.has_next
+    assert page.next_cursor is None
+
+
+def test_keyset_composite_ordering_with_ties():
+    users = [
+        User.objects.create(
+            username=f"user{i}", email=f"user{i}@example.com", first_name=name
+        )
+        for i, name in enumerate(["ada", "ada", "ada", "bob", "bob"])
+    ]
+    order_by = ("first_name", "-id")
+    seen = []
+    page = paginate_queryset_keyset(
+        get_request(), User.objects.all(), page_size=2, order_by=order_by
+    )
+    seen.extend(page.object_list)
+    while page.has_next:
+        page = paginate_queryset_keyset(
+            get_request(f"?cursor={page.next_cursor}"),
+            User.objects.all(),
+            page_size=2,
+            order_by=order_by,
+        )
+        seen.extend(page.object_list)
+    expected = sorted(users, key=lambda u: (u.first_name, -u.pk))
+    assert [u.pk for u in seen] == [u.pk for u in expected]
+
+
+def test_keyset_last_sentinel(users):
+    page = paginate_queryset_keyset(
+        get_request("?cursor=last"), User.objects.all(), page_size=2
+    )
+    assert [u.pk for u in page] == [users[1].pk, users[0].pk]
+    assert not page.has_next
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!!",  # not base64/JSON
+        make_cursor(b"[1, 2]"),  # wrong length for the ordering
+        make_cursor(b'["abc"]'),  # wrong type for an integer pk
+        make_cursor(b"[null]"),
+    ],
+)
+def test_keyset_bad_cursor_raises_404(users, cursor):
+    with pytest.raises(Http404):
+        paginate_queryset_keyset(
+            get_request(f"?cursor={cursor}"), User.objects.all(), page_size=2
+        )
+
+
+def test_last_page_with_previous(users):
+    # the COUNT-free tail scan serves the last page_size rows rather than
+    # Paginator's shorter orphan page
+    page = paginate_queryset(get_request("?page=last"), User.objects.all(), page_size=2)
+    assert [u.pk for u in page] == [users[3].pk, users[4].pk]
+    assert not page.has_next()
+    assert page.has_previous()
+
+
+def test_last_page_is_also_first(users):
+    page = paginate_queryset(
+        get_request("?page=last"), User.objects.all(), page_size=10
+    )
+    assert [u.pk for u in page] == [u.pk for u in users]
+    assert not page.has_next()
+    assert not page.has_previous()
+
+
+def test_batched_iterator(users):
+    batches = list(batched_iterator(User.objects.order_by("id"), batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [u.pk for batch in batches for u in batch] == [u.pk for u in users]